@@ -1,42 +1,47 @@
-import pandas as pd
+import numpy as np
 from shiny import App, render, reactive, ui
 
-data = {
-    'total_bill': [16.99, 10.34, 21.01, 23.68, 24.59],
-    'tip': [1.01, 1.66, 3.50, 3.31, 3.61],
-    'sex': ['Female', 'Male', 'Male', 'Male', 'Female'],
-    'smoker': ['No', 'No', 'No', 'No', 'Yes'],
-    'day': ['Sun', 'Sun', 'Sun', 'Fri', 'Sun'],
-    'time': ['Lunch', 'Dinner', 'Dinner', 'Dinner', 'Dinner'],
-    'size': [2, 3, 3, 2, 4]
-}
+from tips_data import load_tips
 
-tips = pd.DataFrame(data)
+# copy with categoricals, the loaded DataFrame is shared
+tips = load_tips().astype({"day": "category", "time": "category"})
+
+# categories are already the sorted unique values of each column
+DAY_CHOICES = tips["day"].cat.categories.tolist()
+TIME_CHOICES = tips["time"].cat.categories.tolist()
 
 app_ui = ui.page_sidebar(
     ui.sidebar(
         ui.input_checkbox_group(
                 "filter_day",
                 "Day:",
-                {x:x for x in sorted(tips["day"].unique())},
+                DAY_CHOICES,
         ),
         ui.input_checkbox_group(
                 "filter_time",
                 "Time:",
-                {x:x for x in sorted(tips["time"].unique())},
+                TIME_CHOICES,
         ),
     ),
     ui.output_data_frame("render_df"),
 )
 
 def server(input, output, session):
+    @reactive.calc
+    def day_mask():
+        if not input.filter_day():
+            return np.ones(len(tips), dtype=bool)
+        return tips["day"].isin(input.filter_day()).to_numpy()
+
+    @reactive.calc
+    def time_mask():
+        if not input.filter_time():
+            return np.ones(len(tips), dtype=bool)
+        return tips["time"].isin(input.filter_time()).to_numpy()
+
     @reactive.calc
     def data_filtered():
-        df = tips
-        if input.filter_day():
-            df = df.loc[df["day"].isin(input.filter_day())]
-        if input.filter_time():
-            df = df.loc[df["time"].isin(input.filter_time())]
+        df = tips.loc[day_mask() & time_mask()]
         return df
 
     @render.data_frame
@@ -1,7 +1,9 @@
-import pandas as pd
 from shiny import App, render, reactive, ui
 
 import shiny_adaptive_filter as saf
+from tips_data import load_tips
+
+tips = load_tips()
 
 app_ui = ui.page_sidebar(
     ui.sidebar(
@@ -34,16 +36,4 @@ def server(input, output, session):
     )
     filter_idx = filter_return["filter_idx"]
 
-data = {
-    'total_bill': [16.99, 10.34, 21.01, 23.68, 24.59],
-    'tip': [1.01, 1.66, 3.50, 3.31, 3.61],
-    'sex': ['Female', 'Male', 'Male', 'Male', 'Female'],
-    'smoker': ['No', 'No', 'No', 'No', 'Yes'],
-    'day': ['Sun', 'Sun', 'Sun', 'Fri', 'Sun'],
-    'time': ['Lunch', 'Dinner', 'Dinner', 'Dinner', 'Dinner'],
-    'size': [2, 3, 3, 2, 4]
-}
-
-tips = pd.DataFrame(data)
-
 app = App(app_ui, server)
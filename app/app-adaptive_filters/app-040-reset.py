@@ -1,7 +1,9 @@
-import pandas as pd
 from shiny import App, render, reactive, ui
 
 import shiny_adaptive_filter as saf
+from tips_data import load_tips
+
+tips = load_tips()
 
 app_ui = ui.page_sidebar(
     ui.sidebar(
@@ -12,9 +14,20 @@ app_ui = ui.page_sidebar(
 )
 
 def server(input, output, session):
+    # resetting updates every filter, which can recompute filter_idx()
+    # several times, only pass it along when the rows actually change
+    filter_idx_rows = reactive.value(tips.index)
+
+    @reactive.effect
+    def _():
+        idx = filter_idx()
+        with reactive.isolate():
+            if not idx.equals(filter_idx_rows()):
+                filter_idx_rows.set(idx)
+
     @reactive.calc
     def data_filtered():
-        df = tips.loc[filter_idx()]
+        df = tips.loc[filter_idx_rows()]
         return df
 
     @render.data_frame
@@ -39,16 +52,4 @@ def server(input, output, session):
     filter_idx = filter_return["filter_idx"]
     adaptive_reset_all = filter_return["reset_all"] # <<
 
-data = {
-    'total_bill': [16.99, 10.34, 21.01, 23.68, 24.59],
-    'tip': [1.01, 1.66, 3.50, 3.31, 3.61],
-    'sex': ['Female', 'Male', 'Male', 'Male', 'Female'],
-    'smoker': ['No', 'No', 'No', 'No', 'Yes'],
-    'day': ['Sun', 'Sun', 'Sun', 'Fri', 'Sun'],
-    'time': ['Lunch', 'Dinner', 'Dinner', 'Dinner', 'Dinner'],
-    'size': [2, 3, 3, 2, 4]
-}
-
-tips = pd.DataFrame(data)
-
 app = App(app_ui, server)
@@ -0,0 +1,23 @@
+import functools
+
+import pandas as pd
+
+data = {
+    'total_bill': [16.99, 10.34, 21.01, 23.68, 24.59],
+    'tip': [1.01, 1.66, 3.50, 3.31, 3.61],
+    'sex': ['Female', 'Male', 'Male', 'Male', 'Female'],
+    'smoker': ['No', 'No', 'No', 'No', 'Yes'],
+    'day': ['Sun', 'Sun', 'Sun', 'Fri', 'Sun'],
+    'time': ['Lunch', 'Dinner', 'Dinner', 'Dinner', 'Dinner'],
+    'size': [2, 3, 3, 2, 4]
+}
+
+
+@functools.cache
+def load_tips() -> pd.DataFrame:
+    """Sample of the tips data used by the adaptive filter apps.
+
+    The DataFrame is only built once per process and the same object is
+    returned on every call, so treat it as read-only.
+    """
+    return pd.DataFrame(data)
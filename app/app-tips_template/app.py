@@ -92,13 +92,9 @@ app_ui = ui.page_sidebar(
 
 
 def server(input, output, session):
-    @reactive.calc
-    def tips_original():
-        return tips
-
     @reactive.calc
     def tips_data():
-        return tips_original().loc[adaptive_filters_idx()]
+        return tips.loc[adaptive_filters_idx()]
 
     @render.ui
     def total_tippers():
@@ -180,7 +176,7 @@ def server(input, output, session):
     }
 
     adaptive_filters = adaptive_filter_module.filter_server(
-        "adaptive", df=tips_original, override=override
+        "adaptive", df=tips, override=override
     )
     adaptive_filters_idx = adaptive_filters["filter_idx"]
     adaptive_reset_all = adaptive_filters["reset_all"]
@@ -1,7 +1,7 @@
 # pyright: strict
 
 #from __future__ import annotations
-from typing import Any, List, cast
+from typing import Any, cast
 
 import pandas as pd
 from shiny import reactive
@@ -28,20 +28,18 @@ def return_index(df: pd.DataFrame) -> "pd.Index[Any]":
     return cast("pd.Index[Any]", df.index)
 
 
-idx: set[int] = set(cast("pd.Index[Any]", df.index)) # <<
-
 var: "pd.Index[Any]"= df.index
 
 @reactive.calc
-def filter_idx() -> List[pd.Index[Any]]:
-    idx: set[int] = set(cast(pd.Index[Any], df.index)) # <<
+def filter_idx() -> "pd.Index[Any]":
+    idx: "pd.Index[Any]" = df.index # <<
 
 
     current_idx: pd.Index[Any] = df.loc[df["day"].isin(input.filter_day())].index
-    idx: Set[pd.Index] = idx.intersection(set(current_idx)) # <<
+    idx = idx.intersection(current_idx) # <<
 
 
-    current_idx: pd.Index[Any] = df.loc[df["time"].isin(input.filter_time())].index
-    idx = idx.intersection(set(current_idx)) # <<
+    current_idx = df.loc[df["time"].isin(input.filter_time())].index
+    idx = idx.intersection(current_idx) # <<
 
-    return list(idx) # list because .loc[] would return TypeError# <<
+    return idx # .loc[] takes an Index, only a set raises TypeError # <<